@@ -1,9 +1,17 @@
-from django.db.models import Prefetch
+import copy
+from types import MappingProxyType
+
+from django.db import connections, router
+from django.db.models import Manager, Model, Prefetch
+from django.db.models.signals import post_save, pre_save
 from django.db.models.fields.related import ManyToManyRel, ManyToOneRel
 from django.http import QueryDict
 from django.utils.functional import cached_property
 
-from rest_framework.serializers import ListSerializer, Serializer, ValidationError
+from rest_framework.serializers import (
+    BaseSerializer, ListSerializer, ModelSerializer, Serializer, ValidationError
+)
+from rest_framework.utils.serializer_helpers import BindingDict
 
 from .exceptions import FieldNotFound, QueryFormatError
 from .fields import (
@@ -16,6 +24,8 @@ from .operations import ADD, CREATE, REMOVE, UPDATE
 from .parser import Query, QueryParser
 from .settings import restql_settings
 
+NESTED_FIELD_CLASSES = (Serializer, ListSerializer, DynamicSerializerMethodField)
+
 
 class RequestQueryParserMixin(object):
     """
@@ -39,8 +49,7 @@ class RequestQueryParserMixin(object):
             # Use cached parsed restql query
             return request.parsed_restql_query
         raw_query = request.GET[restql_settings.QUERY_PARAM_NAME]
-        parser = QueryParser()
-        parsed_restql_query = parser.parse(raw_query)
+        parsed_restql_query = QueryParser.parse_cached(raw_query)
 
         # Save parsed restql query to the request so that
         # we won't need to parse it again if needed later
@@ -76,7 +85,7 @@ class QueryArgumentsMixin(RequestQueryParserMixin):
         if parent is None:
             query_params.update(parsed_query.arguments)
         else:
-            prefix = parent + "__"
+            prefix = f"{parent}__"
             for argument, value in parsed_query.arguments.items():
                 name = prefix + argument
                 query_params.update({name: value})
@@ -110,6 +119,18 @@ class QueryArgumentsMixin(RequestQueryParserMixin):
 
 
 class DynamicFieldsMixin(RequestQueryParserMixin):
+    # Opt in to calling `get_fields` only once per serializer class,
+    # don't use it if `get_fields` depends on the serializer instance
+    cache_restql_fields = False
+
+    # Unbound fields returned by `get_fields`, cached per serializer class
+    _restql_base_fields = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Don't let a subclass reuse the fields cached by its parent
+        cls._restql_base_fields = None
+
     def __init__(self, *args, **kwargs):
         # Don't pass DynamicFieldsMixin's kwargs to the superclass
         self.dynamic_fields_mixin_kwargs = {
@@ -147,29 +168,48 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
             return instance.pk
         return super().to_representation(instance)
 
+    def get_restql_base_fields(self):
+        """
+        Returns a fresh copy of the fields returned by `get_fields`,
+        `get_fields` is called only once per serializer class.
+        """
+        cls = self.__class__
+        if cls._restql_base_fields is None:
+            cls._restql_base_fields = self.get_fields()
+
+        # Fields are deep copied(just like DRF does with declared fields)
+        # because some of them hold state which must not be shared between
+        # serializer instances e.g `child` on `ListSerializer`
+        return copy.deepcopy(cls._restql_base_fields)
+
     @cached_property
     def allowed_fields(self):
-        fields = super().fields
+        if self.cache_restql_fields:
+            fields = BindingDict(self)
+            for field_name, field in self.get_restql_base_fields().items():
+                fields[field_name] = field
+        else:
+            fields = super().fields
         if self.dynamic_fields_mixin_kwargs["fields"] is not None:
             # Drop all fields which are not specified on the `fields` kwarg.
             allowed = set(self.dynamic_fields_mixin_kwargs["fields"])
-            existing = set(fields)
-            not_allowed = existing.symmetric_difference(allowed)
-            for field_name in not_allowed:
-                try:
+            for field_name in tuple(fields):
+                if field_name not in allowed:
                     fields.pop(field_name)
-                except KeyError:
-                    msg = "Field `%s` is not found" % field_name
-                    raise FieldNotFound(msg) from None
 
-        if self.dynamic_fields_mixin_kwargs["exclude"] is not None:
+            for field_name in allowed:
+                if field_name not in fields:
+                    msg = f"Field `{field_name}` is not found"
+                    raise FieldNotFound(msg)
+
+        if self.dynamic_fields_mixin_kwargs["exclude"]:
             # Drop all fields specified on the `exclude` kwarg.
             not_allowed = set(self.dynamic_fields_mixin_kwargs["exclude"])
             for field_name in not_allowed:
                 try:
                     fields.pop(field_name)
                 except KeyError:
-                    msg = "Field `%s` is not found" % field_name
+                    msg = f"Field `{field_name}` is not found"
                     raise FieldNotFound(msg) from None
         return fields
 
@@ -179,18 +219,17 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
             return True
         else:
             if raise_exception:
-                msg = "`%s` field is not found" % field_name
+                msg = f"`{field_name}` field is not found"
                 raise ValidationError(msg, code="not_found")
             return False
 
     @staticmethod
     def is_nested_field(field_name, field, raise_exception=False):
-        nested_classes = (Serializer, ListSerializer, DynamicSerializerMethodField)
-        if isinstance(field, nested_classes):
+        if isinstance(field, NESTED_FIELD_CLASSES):
             return True
         else:
             if raise_exception:
-                msg = "`%s` is not a nested field" % field_name
+                msg = f"`{field_name}` is not a nested field"
                 raise ValidationError(msg, code="invalid")
             return False
 
@@ -231,6 +270,15 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
 
         include_all_fields = False  # Assume the * is not set initially
 
+        # Check if all included fields exist at once, if they don't
+        # they are checked one by one below so that errors are
+        # reported in the order of fields in a query
+        all_included_fields_found = all_fields.keys() >= {
+            field.field_name if isinstance(field, Query) else field
+            for field in included_fields
+            if field != "*"
+        }
+
         # Go through all included fields to check if
         # they are all valid and to set `nested_fields`
         # property on parent fields for future reference
@@ -244,7 +292,8 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
                 # Nested field
                 alias = parsed_query.aliases.get(field.field_name, field.field_name)
 
-                self.is_field_found(field.field_name, all_fields, raise_exception=True)
+                if not all_included_fields_found:
+                    self.is_field_found(field.field_name, all_fields, raise_exception=True)
                 self.is_nested_field(
                     field.field_name, all_fields[field.field_name], raise_exception=True
                 )
@@ -252,15 +301,16 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
             else:
                 # Flat field
                 alias = parsed_query.aliases.get(field, field)
-                self.is_field_found(field, all_fields, raise_exception=True)
+                if not all_included_fields_found:
+                    self.is_field_found(field, all_fields, raise_exception=True)
                 allowed_flat_fields.append(alias)
 
         def get_duplicates(items):
-            unique = []
+            unique = set()
             repeated = []
             for item in items:
                 if item not in unique:
-                    unique.append(item)
+                    unique.add(item)
                 else:
                     repeated.append(item)
             return repeated
@@ -290,25 +340,25 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
             # is not empty which means the user specified fields to exclude,
             # so we just check if provided fields exists then remove them from
             # a list of all fields
+            if not all_fields.keys() >= set(excluded_fields):
+                # Report the first field which is not found
+                for field in excluded_fields:
+                    self.is_field_found(field, all_fields, raise_exception=True)
+
             for field in excluded_fields:
-                self.is_field_found(field, all_fields, raise_exception=True)
                 all_fields.pop(field)
 
         elif included_fields and not include_all_fields:
             # Here we are sure that parsed_query.excluded_fields
             # is empty which means the exclude operator(-) has not been used,
             # so parsed_query.included_fields contains only selected fields
-            all_allowed_fields = set(allowed_flat_fields) | set(
-                allowed_nested_fields.keys()
-            )
-
-            existing_fields = set(all_fields.keys())
+            all_allowed_fields = set(allowed_flat_fields)
+            all_allowed_fields.update(allowed_nested_fields)
 
-            non_selected_fields = existing_fields - all_allowed_fields
-
-            for field in non_selected_fields:
-                # Remove it because we're sure it has not been selected
-                all_fields.pop(field)
+            for field in tuple(all_fields):
+                if field not in all_allowed_fields:
+                    # Remove it because we're sure it has not been selected
+                    all_fields.pop(field)
 
         elif include_all_fields:
             # Here we are sure both parsed_query.excluded_fields and
@@ -336,10 +386,10 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
             try:
                 parsed_restql_query = self.get_parsed_restql_query()
             except SyntaxError as e:
-                msg = "QuerySyntaxError: " + e.msg + " on " + e.text
+                msg = f"QuerySyntaxError: {e.msg} on {e.text}"
                 raise ValidationError(msg, code="invalid") from None
             except QueryFormatError as e:
-                msg = "QueryFormatError: " + str(e)
+                msg = f"QueryFormatError: {e}"
                 raise ValidationError(msg, code="invalid") from None
 
         elif isinstance(self.parent, ListSerializer):
@@ -370,8 +420,7 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
         return selected_fields
 
     def get_parsed_restql_query_from_query_kwarg(self):
-        parser = QueryParser()
-        return parser.parse(self.dynamic_fields_mixin_kwargs["query"])
+        return QueryParser.parse_cached(self.dynamic_fields_mixin_kwargs["query"])
 
     def get_parsed_restql_query(self):
         request = self.context.get("request")
@@ -401,11 +450,21 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
 
 
 class EagerLoadingMixin(RequestQueryParserMixin):
-    @property
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Mappings declared on a view class are shared by all requests,
+        # so make them read only to prevent accidental mutation
+        for attr in ("select_related", "prefetch_related"):
+            mapping = cls.__dict__.get(attr)
+            if isinstance(mapping, dict):
+                setattr(cls, attr, MappingProxyType(mapping.copy()))
+
+    @cached_property
     def parsed_restql_query(self):
         """
         Gets parsed query for use in eager loading.
         Defaults to the serializer parsed query.
+        It's cached on the view instance, which lives for a single request.
         """
         if self.has_restql_query_param(self.request):
             try:
@@ -449,21 +508,23 @@ class EagerLoadingMixin(RequestQueryParserMixin):
         Returns the parsed query as a dict.
         """
         parsed_query = {}
-        included_fields = parsed_restql_query.included_fields
-        excluded_fields = parsed_restql_query.excluded_fields
 
-        for field in included_fields:
-            if isinstance(field, Query):
-                nested_keys = cls.get_dict_parsed_restql_query(field)
-                parsed_query[field.field_name] = nested_keys
-            else:
-                parsed_query[field] = True
-        for field in excluded_fields:
-            if isinstance(field, Query):
-                nested_keys = cls.get_dict_parsed_restql_query(field)
-                parsed_query[field.field_name] = nested_keys
-            else:
-                parsed_query[field] = False
+        # Walk nested queries with a stack instead of recursion,
+        # each item is a query and the dict to populate from it
+        stack = [(parsed_restql_query, parsed_query)]
+        while stack:
+            query, query_dict = stack.pop()
+            for field in query.included_fields:
+                if isinstance(field, Query):
+                    nested_query_dict = {}
+                    query_dict[field.field_name] = nested_query_dict
+                    stack.append((field, nested_query_dict))
+                else:
+                    query_dict[field] = True
+            for field in query.excluded_fields:
+                # Excluded fields are always flat since the exclude
+                # operator(-) can't be applied on a parent field
+                query_dict[field] = False
         return parsed_query
 
     @staticmethod
@@ -533,6 +594,20 @@ class EagerLoadingMixin(RequestQueryParserMixin):
 
 
 class BaseNestedMixin(object):
+    # Maps the source of a nested field to its kind of relation,
+    # cached per serializer class
+    _restql_nested_field_kinds = None
+
+    # Maps the source of a many to one nested field to the name
+    # of the foreign key on the related model, cached per serializer class
+    _restql_foreignkey_names = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Don't let a subclass reuse the values cached by its parent
+        cls._restql_nested_field_kinds = {}
+        cls._restql_foreignkey_names = {}
+
     def get_fields(self):
         # Replace all temporary fields with the actual fields
         fields = super().get_fields()
@@ -553,6 +628,167 @@ class BaseNestedMixin(object):
                 writable_nested_fields.update({field.source: field})
         return writable_nested_fields
 
+    @staticmethod
+    def can_bulk_create(serializer_class):
+        """
+        Checks if objects can be created with a single `bulk_create` query
+        without skipping any logic which would run on `serializer.save()`
+        """
+        if serializer_class.create is not ModelSerializer.create:
+            # The serializer has its own way of creating objects
+            return False
+
+        if serializer_class.save is not BaseSerializer.save:
+            # `bulk_create` doesn't call `serializer.save()`
+            return False
+
+        model = serializer_class.Meta.model
+        if model._meta.parents or model.save is not Model.save:
+            # `bulk_create` doesn't work with multi-table inheritance
+            # and it doesn't call `Model.save`
+            return False
+
+        if type(model._default_manager).create is not Manager.create:
+            # `ModelSerializer.create` calls the manager's `create`
+            # which `bulk_create` doesn't
+            return False
+
+        if pre_save.has_listeners(model) or post_save.has_listeners(model):
+            # `bulk_create` doesn't send save signals
+            return False
+
+        has_unique_fields = any(
+            field.unique and not field.primary_key
+            for field in model._meta.concrete_fields
+        )
+        has_constraints = (
+            # `constraints` is only available on Django >= 2.2
+            model._meta.unique_together or getattr(model._meta, "constraints", ())
+        )
+        if has_unique_fields or has_constraints:
+            # Objects are validated before any of them is saved so
+            # uniqueness between them can't be validated
+            return False
+
+        # We need pks of created objects
+        features = connections[router.db_for_write(model)].features
+        return getattr(
+            features, "can_return_rows_from_bulk_insert",
+            getattr(features, "can_return_ids_from_bulk_insert", False)
+        )
+
+    def bulk_create_objs(self, field, data):
+        nested_fields = self.restql_writable_nested_fields
+
+        # Get nested field serializer
+        nested_field_serializer = nested_fields[field].child
+        serializer_class = nested_field_serializer.serializer_class
+        kwargs = nested_field_serializer.validation_kwargs
+        model = serializer_class.Meta.model
+
+        concrete_fields = set()
+        if self.can_bulk_create(serializer_class):
+            for model_field in model._meta.concrete_fields:
+                concrete_fields.update((model_field.name, model_field.attname))
+
+        pks = []
+        unsaved_objs = []
+        # Positions of unsaved objects in `pks`
+        unsaved_objs_indexes = []
+        for values in data:
+            serializer = serializer_class(
+                **kwargs,
+                data=values,
+                # Reject partial update by default(if partial kwarg is not passed)
+                # since we need all required fields when creating object
+                partial=nested_field_serializer.is_partial(False),
+                context=self.context,
+            )
+            serializer.is_valid(raise_exception=True)
+            validated_data = serializer.validated_data
+            if validated_data and concrete_fields.issuperset(validated_data):
+                # Save it later together with others in a single query
+                unsaved_objs_indexes.append(len(pks))
+                unsaved_objs.append(model(**validated_data))
+                pks.append(None)
+            else:
+                # There are values(e.g many to many) which can't
+                # be set on an unsaved object or bulk create isn't allowed
+                obj = serializer.save()
+                pks.append(obj.pk)
+
+        if unsaved_objs:
+            objs = model._default_manager.bulk_create(unsaved_objs)
+            for index, obj in zip(unsaved_objs_indexes, objs):
+                pks[index] = obj.pk
+        return pks
+
+    def get_restql_nested_field_kind(self, field, field_serializer):
+        """
+        Returns the kind of relation of a nested field, which is one of
+        `foreignkey_related`, `many_to_one_related`, `many_to_many_related`
+        or None if a field is neither of these.
+        """
+        kinds = self.__class__._restql_nested_field_kinds
+        if field in kinds:
+            return kinds[field]
+
+        kind = None
+        if isinstance(field_serializer, Serializer):
+            kind = "foreignkey_related"
+        elif isinstance(field_serializer, ListSerializer):
+            rel = getattr(self.Meta.model, field).rel
+            if isinstance(rel, ManyToOneRel):
+                kind = "many_to_one_related"
+            elif isinstance(rel, ManyToManyRel):
+                kind = "many_to_many_related"
+
+        kinds[field] = kind
+        return kind
+
+    def get_restql_foreignkey_name(self, field):
+        """
+        Returns the name of the foreign key which points back to
+        this serializer's model from a many to one related model.
+        """
+        foreignkey_names = self.__class__._restql_foreignkey_names
+        if field not in foreignkey_names:
+            foreignkey = getattr(self.Meta.model, field).field.name
+            foreignkey_names[field] = foreignkey
+        return foreignkey_names[field]
+
+    def pop_restql_nested_data(self, validated_data):
+        """
+        Pops values of nested fields from `validated_data` and
+        groups them according to their kind of relation.
+        """
+        nested_data = {
+            "replaceable_foreignkey_related": {},
+            "writable_foreignkey_related": {},
+            "many_to_one_related": {},
+            "many_to_many_related": {},
+        }
+
+        restql_nested_fields = self.restql_writable_nested_fields
+        for field, field_serializer in restql_nested_fields.items():
+            if field not in validated_data:
+                # Nested field value is not provided
+                continue
+
+            kind = self.get_restql_nested_field_kind(field, field_serializer)
+            if kind is None:
+                continue
+
+            if kind == "foreignkey_related":
+                # This is not cached since it might change
+                # depending on the data passed to a field
+                if field_serializer.is_replaceable:
+                    kind = "replaceable_foreignkey_related"
+                else:
+                    kind = "writable_foreignkey_related"
+            nested_data[kind][field] = validated_data.pop(field)
+        return nested_data
+
 
 class NestedCreateMixin(BaseNestedMixin):
     """Create Mixin"""
@@ -583,28 +819,6 @@ class NestedCreateMixin(BaseNestedMixin):
                 objs.update({field: obj})
         return objs
 
-    def bulk_create_objs(self, field, data):
-        nested_fields = self.restql_writable_nested_fields
-
-        # Get nested field serializer
-        nested_field_serializer = nested_fields[field].child
-        serializer_class = nested_field_serializer.serializer_class
-        kwargs = nested_field_serializer.validation_kwargs
-        pks = []
-        for values in data:
-            serializer = serializer_class(
-                **kwargs,
-                data=values,
-                # Reject partial update by default(if partial kwarg is not passed)
-                # since we need all required fields when creating object
-                partial=nested_field_serializer.is_partial(False),
-                context=self.context,
-            )
-            serializer.is_valid(raise_exception=True)
-            obj = serializer.save()
-            pks.append(obj.pk)
-        return pks
-
     def create_many_to_one_related(self, instance, data):
         # data format
         # {field: {
@@ -612,15 +826,14 @@ class NestedCreateMixin(BaseNestedMixin):
         # CREATE: [{sub_field: value}]
         # }...}
         field_pks = {}
+        nested_fields = self.restql_writable_nested_fields
         for field, values in data.items():
-            model = self.Meta.model
-            foreignkey = getattr(model, field).field.name
-            nested_fields = self.restql_writable_nested_fields
+            foreignkey = self.get_restql_foreignkey_name(field)
             for operation in values:
                 if operation == ADD:
                     pks = values[operation]
-                    model = nested_fields[field].child.Meta.model
-                    qs = model.objects.filter(pk__in=pks)
+                    nested_model = nested_fields[field].child.Meta.model
+                    qs = nested_model.objects.filter(pk__in=pks)
                     qs.update(**{foreignkey: instance.pk})
                     field_pks.update({field: pks})
                 elif operation == CREATE:
@@ -654,62 +867,32 @@ class NestedCreateMixin(BaseNestedMixin):
         # Make a copy of validated_data so that we don't
         # alter it in case user need to access it later
         validated_data_copy = {**validated_data}
-
-        fields = {
-            "foreignkey_related": {"replaceable": {}, "writable": {}},
-            "many_to": {"many_related": {}, "one_related": {}},
-        }
-
-        restql_nested_fields = self.restql_writable_nested_fields
-        for field in restql_nested_fields:
-            if field not in validated_data_copy:
-                # Nested field value is not provided
-                continue
-
-            field_serializer = restql_nested_fields[field]
-
-            if isinstance(field_serializer, Serializer):
-                if field_serializer.is_replaceable:
-                    value = validated_data_copy.pop(field)
-                    fields["foreignkey_related"]["replaceable"].update({field: value})
-                else:
-                    value = validated_data_copy.pop(field)
-                    fields["foreignkey_related"]["writable"].update({field: value})
-            elif isinstance(field_serializer, ListSerializer):
-                model = self.Meta.model
-                rel = getattr(model, field).rel
-
-                if isinstance(rel, ManyToOneRel):
-                    value = validated_data_copy.pop(field)
-                    fields["many_to"]["one_related"].update({field: value})
-                elif isinstance(rel, ManyToManyRel):
-                    value = validated_data_copy.pop(field)
-                    fields["many_to"]["many_related"].update({field: value})
+        nested_data = self.pop_restql_nested_data(validated_data_copy)
 
         foreignkey_related = {
-            **fields["foreignkey_related"]["replaceable"],
+            **nested_data["replaceable_foreignkey_related"],
             **self.create_writable_foreignkey_related(
-                fields["foreignkey_related"]["writable"]
+                nested_data["writable_foreignkey_related"]
             ),
         }
         # combine_all_data here
         validated_data_copy = {**validated_data_copy, **foreignkey_related}
-        model_class = self.Meta.model
+        model = self.Meta.model
         constrained_data = dict()
-        for constraint in model_class._meta.constraints:
+        for constraint in model._meta.constraints:
             for field in constraint.fields:
                 if field in validated_data_copy:
                     constrained_data[field] = validated_data_copy.pop(field)
 
         if constrained_data:
-            instance, created = model_class._default_manager.update_or_create(
+            instance, created = model._default_manager.update_or_create(
                 **constrained_data, defaults=validated_data_copy
             )
         else:
             instance = super().create(validated_data_copy)
 
-        self.create_many_to_many_related(instance, fields["many_to"]["many_related"])
-        self.create_many_to_one_related(instance, fields["many_to"]["one_related"])
+        self.create_many_to_many_related(instance, nested_data["many_to_many_related"])
+        self.create_many_to_one_related(instance, nested_data["many_to_one_related"])
         return instance
 
 
@@ -718,7 +901,7 @@ class NestedUpdateMixin(BaseNestedMixin):
 
     @staticmethod
     def constrain_error_prefix(field):
-        return "Error on `%s` field: " % (field,)
+        return f"Error on `{field}` field: "
 
     @staticmethod
     def update_replaceable_foreignkey_related(instance, data):
@@ -762,45 +945,28 @@ class NestedUpdateMixin(BaseNestedMixin):
             instance.save()
 
     def bulk_create_many_to_many_related(self, field, nested_obj, data):
-        # Get nested field serializer
-        nested_field_serializer = self.restql_writable_nested_fields[field].child
-        serializer_class = nested_field_serializer.serializer_class
-        kwargs = nested_field_serializer.validation_kwargs
-        pks = []
-        for values in data:
-            serializer = serializer_class(
-                **kwargs,
-                data=values,
-                # Reject partial update by default(if partial kwarg is not passed)
-                # since we need all required fields when creating object
-                partial=nested_field_serializer.is_partial(False),
-                context=self.context,
-            )
-            serializer.is_valid(raise_exception=True)
-            obj = serializer.save()
-            pks.append(obj.pk)
+        pks = self.bulk_create_objs(field, data)
         nested_obj.add(*pks)
         return pks
 
     def bulk_create_many_to_one_related(self, field, nested_obj, data):
-        # Get nested field serializer
-        nested_field_serializer = self.restql_writable_nested_fields[field].child
-        serializer_class = nested_field_serializer.serializer_class
-        kwargs = nested_field_serializer.validation_kwargs
-        pks = []
-        for values in data:
-            serializer = serializer_class(
-                **kwargs,
-                data=values,
-                # Reject partial update by default(if partial kwarg is not passed)
-                # since we need all required fields when creating object
-                partial=nested_field_serializer.is_partial(False),
-                context=self.context,
-            )
-            serializer.is_valid(raise_exception=True)
-            obj = serializer.save()
-            pks.append(obj.pk)
-        return pks
+        return self.bulk_create_objs(field, data)
+
+    @staticmethod
+    def get_objs_to_update(nested_obj, pks):
+        """
+        Returns objects with the given pks(in the same order)
+        using a single query
+        """
+        pk_field = nested_obj.model._meta.pk
+        pks = [pk_field.to_python(pk) for pk in pks]
+        objs = nested_obj.in_bulk(pks)
+        try:
+            return [objs[pk] for pk in pks]
+        except KeyError:
+            model_name = nested_obj.model._meta.object_name
+            msg = f"{model_name} matching query does not exist."
+            raise nested_obj.model.DoesNotExist(msg) from None
 
     def bulk_update_many_to_many_related(self, field, nested_obj, data):
         # {pk: {sub_field: values}}
@@ -809,8 +975,8 @@ class NestedUpdateMixin(BaseNestedMixin):
         nested_field_serializer = self.restql_writable_nested_fields[field].child
         serializer_class = nested_field_serializer.serializer_class
         kwargs = nested_field_serializer.validation_kwargs
-        for pk, values in data.items():
-            obj = nested_obj.get(pk=pk)
+        objs = self.get_objs_to_update(nested_obj, data.keys())
+        for obj, values in zip(objs, data.values()):
             serializer = serializer_class(
                 obj,
                 **kwargs,
@@ -830,11 +996,10 @@ class NestedUpdateMixin(BaseNestedMixin):
         nested_field_serializer = self.restql_writable_nested_fields[field].child
         serializer_class = nested_field_serializer.serializer_class
         kwargs = nested_field_serializer.validation_kwargs
-        model = self.Meta.model
-        foreignkey = getattr(model, field).field.name
+        foreignkey = self.get_restql_foreignkey_name(field)
         nested_obj = getattr(instance, field)
-        for pk, values in data.items():
-            obj = nested_obj.get(pk=pk)
+        objs = self.get_objs_to_update(nested_obj, data.keys())
+        for obj, values in zip(objs, data.values()):
             values.update({foreignkey: instance.pk})
             serializer = serializer_class(
                 obj,
@@ -856,16 +1021,15 @@ class NestedUpdateMixin(BaseNestedMixin):
         # REMOVE: [pk],
         # UPDATE: {pk: {sub_field: value}}
         # }...}
+        nested_fields = self.restql_writable_nested_fields
         for field, values in data.items():
             nested_obj = getattr(instance, field)
-            model = self.Meta.model
-            foreignkey = getattr(model, field).field.name
-            nested_fields = self.restql_writable_nested_fields
+            foreignkey = self.get_restql_foreignkey_name(field)
             for operation in values:
                 if operation == ADD:
                     pks = values[operation]
-                    model = nested_fields[field].child.Meta.model
-                    qs = model.objects.filter(pk__in=pks)
+                    nested_model = nested_fields[field].child.Meta.model
+                    qs = nested_model.objects.filter(pk__in=pks)
                     qs.update(**{foreignkey: instance.pk})
                 elif operation == CREATE:
                     for v in values[operation]:
@@ -874,17 +1038,17 @@ class NestedUpdateMixin(BaseNestedMixin):
                         field, nested_obj, values[operation]
                     )
                 elif operation == REMOVE:
-                    qs = nested_obj.all()
                     if values[operation] == ALL_RELATED_OBJS:
-                        qs.delete()
+                        qs = nested_obj.all()
                     else:
-                        qs.filter(pk__in=values[operation]).delete()
+                        qs = nested_obj.filter(pk__in=values[operation])
+                    qs.delete()
                 elif operation == UPDATE:
                     self.bulk_update_many_to_one_related(
                         field, instance, values[operation]
                     )
                 else:
-                    message = "`%s` is an invalid operation" % (operation,)
+                    message = f"`{operation}` is an invalid operation"
                     raise ValidationError(message, code="invalid_operation")
         return instance
 
@@ -926,7 +1090,7 @@ class NestedUpdateMixin(BaseNestedMixin):
                         field, nested_obj, values[operation]
                     )
                 else:
-                    message = "`%s` is an invalid operation" % (operation,)
+                    message = f"`{operation}` is an invalid operation"
                     raise ValidationError(message, code="invalid_operation")
         return instance
 
@@ -934,50 +1098,20 @@ class NestedUpdateMixin(BaseNestedMixin):
         # Make a copty of validated_data so that we don't
         # alter it in case user need to access it later
         validated_data_copy = {**validated_data}
-
-        fields = {
-            "foreignkey_related": {"replaceable": {}, "writable": {}},
-            "many_to": {"many_related": {}, "one_related": {}},
-        }
-
-        restql_nested_fields = self.restql_writable_nested_fields
-        for field in restql_nested_fields:
-            if field not in validated_data_copy:
-                # Nested field value is not provided
-                continue
-
-            field_serializer = restql_nested_fields[field]
-
-            if isinstance(field_serializer, Serializer):
-                if field_serializer.is_replaceable:
-                    value = validated_data_copy.pop(field)
-                    fields["foreignkey_related"]["replaceable"].update({field: value})
-                else:
-                    value = validated_data_copy.pop(field)
-                    fields["foreignkey_related"]["writable"].update({field: value})
-            elif isinstance(field_serializer, ListSerializer):
-                model = self.Meta.model
-                rel = getattr(model, field).rel
-
-                if isinstance(rel, ManyToOneRel):
-                    value = validated_data_copy.pop(field)
-                    fields["many_to"]["one_related"].update({field: value})
-                elif isinstance(rel, ManyToManyRel):
-                    value = validated_data_copy.pop(field)
-                    fields["many_to"]["many_related"].update({field: value})
+        nested_data = self.pop_restql_nested_data(validated_data_copy)
 
         instance = super().update(instance, validated_data_copy)
 
         self.update_replaceable_foreignkey_related(
-            instance, fields["foreignkey_related"]["replaceable"]
+            instance, nested_data["replaceable_foreignkey_related"]
         )
 
         self.update_writable_foreignkey_related(
-            instance, fields["foreignkey_related"]["writable"]
+            instance, nested_data["writable_foreignkey_related"]
         )
 
-        self.update_many_to_many_related(instance, fields["many_to"]["many_related"])
+        self.update_many_to_many_related(instance, nested_data["many_to_many_related"])
 
-        self.update_many_to_one_related(instance, fields["many_to"]["one_related"])
+        self.update_many_to_one_related(instance, nested_data["many_to_one_related"])
 
         return instance
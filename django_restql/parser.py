@@ -1,5 +1,7 @@
+import copy
 import re
 from collections import namedtuple
+from functools import lru_cache
 
 from pypeg2 import List, contiguous, csl, name, optional, parse
 
@@ -133,7 +135,21 @@ Query = namedtuple(
 )
 
 
+@lru_cache(maxsize=256)
+def _parse_query(parser_class, query):
+    parser = parser_class()
+    return parser.parse(query)
+
+
 class QueryParser(object):
+    @classmethod
+    def parse_cached(cls, query):
+        """
+        Same as `parse` but recently parsed queries are cached, a copy
+        is returned so that the cached query won't be altered.
+        """
+        return copy.deepcopy(_parse_query(cls, query))
+
     def parse(self, query):
         parse_tree = parse(query, Block)
         return self._transform_block(parse_tree, parent_field=None)
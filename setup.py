@@ -45,7 +45,7 @@ setup(
     packages=find_packages(exclude=("tests", "test")),
     package_data={"": ["LICENSE"]},
     install_requires=["pypeg2>=2.15.2", "django>=1.11", "djangorestframework>=3.5"],
-    python_requires=">=3.5",
+    python_requires=">=3.6",
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -1,8 +1,29 @@
+import uuid
+from unittest import mock, skipUnless
+
+from django.db import connection, models
+from django.db.models.signals import post_save, pre_save
 from django.urls import reverse_lazy
+from rest_framework.exceptions import ValidationError
 from rest_framework.test import APITestCase
 
-from tests.testapp.models import Book, Instructor, Course, Phone, Student
-from tests.testapp.serializers import WritableCourseSerializer, WritableStudentSerializer
+from django_restql.exceptions import FieldNotFound
+from django_restql.mixins import BaseNestedMixin, NestedUpdateMixin
+from django_restql.parser import QueryParser
+from tests.testapp.models import Book, Genre, Instructor, Course, Phone, Student, Tag
+from tests.testapp.serializers import (
+    BookSerializer, BookWithContextDependentFieldsSerializer, CourseSerializer, CourseWithBooksWithGenresSerializer,
+    CourseWithCachedFieldsSerializer, PhoneSerializer, WritableBookSerializer,
+    WritableCourseSerializer, WritableStudentSerializer
+)
+from tests.testapp.views import StudentEagerLoadingViewSet
+
+
+def bulk_create_returning_pks(objs, *args, **kwargs):
+    # Behave like a database which returns pks of bulk inserted rows
+    for obj in objs:
+        obj.save(force_insert=True)
+    return objs
 
 
 class DataQueryingTests(APITestCase):
@@ -69,6 +90,81 @@ class DataQueryingTests(APITestCase):
             }
         )
 
+    def test_serializer_fields_are_not_shared_between_instances(self):
+        serializer1 = CourseWithCachedFieldsSerializer(self.course, query='{name, books{title}}')
+        serializer2 = CourseWithCachedFieldsSerializer(self.course, query='{code}')
+
+        self.assertIsNot(serializer1.fields["name"], serializer2.allowed_fields["name"])
+        self.assertIsNot(serializer1.fields["books"], serializer2.allowed_fields["books"])
+        self.assertIs(serializer1.fields["books"].parent, serializer1)
+        self.assertEqual(serializer2.data, {"code": "CS210"})
+        self.assertEqual(
+            serializer1.data,
+            {
+                "name": "Data Structures",
+                "books": [
+                    {"title": "Advanced Data Structures"},
+                    {"title": "Basic Data Structures"}
+                ]
+            }
+        )
+
+    def test_query_errors_are_reported_in_the_order_of_fields(self):
+        serializer = CourseSerializer(self.course, query='{name{title}, unknown}')
+        with self.assertRaises(ValidationError) as cm:
+            serializer.data
+        self.assertEqual(str(cm.exception.detail[0]), "`name` is not a nested field")
+        self.assertEqual(cm.exception.get_codes(), ["invalid"])
+
+        serializer = CourseSerializer(self.course, query='{unknown, name{title}}')
+        with self.assertRaises(ValidationError) as cm:
+            serializer.data
+        self.assertEqual(str(cm.exception.detail[0]), "`unknown` field is not found")
+        self.assertEqual(cm.exception.get_codes(), ["not_found"])
+
+    def test_duplicate_fields_error_is_reported_before_unknown_excluded_fields(self):
+        serializer = CourseSerializer(self.course, query='{-code, -code, -nope}')
+        with self.assertRaises(ValidationError) as cm:
+            serializer.data
+        self.assertIn("included/excluded a field more than once", str(cm.exception.detail[0]))
+
+        serializer = CourseSerializer(self.course, query='{-code, -nope}')
+        with self.assertRaises(ValidationError) as cm:
+            serializer.data
+        self.assertEqual(str(cm.exception.detail[0]), "`nope` field is not found")
+        self.assertEqual(cm.exception.get_codes(), ["not_found"])
+
+    def test_fields_kwarg_with_unknown_field(self):
+        serializer = BookSerializer(self.book1, fields=["title", "publisher"])
+
+        with self.assertRaisesMessage(FieldNotFound, "Field `publisher` is not found"):
+            serializer.data
+
+    def test_fields_kwarg_drops_fields_which_are_not_allowed(self):
+        serializer = BookSerializer(self.book1, fields=["title"])
+
+        self.assertEqual(serializer.data, {"title": "Advanced Data Structures"})
+
+    def test_serializer_fields_depending_on_context_are_not_cached(self):
+        staff_serializer = BookWithContextDependentFieldsSerializer(
+            self.book1, context={"staff": True}
+        )
+        self.assertEqual(list(staff_serializer.data), ["id", "title", "author"])
+
+        serializer = BookWithContextDependentFieldsSerializer(
+            self.book1, context={"staff": False}
+        )
+        self.assertEqual(list(serializer.data), ["id", "title"])
+
+    def test_cached_parsed_query_is_not_shared(self):
+        query = '{name, books{title}}'
+        parsed_query1 = QueryParser.parse_cached(query)
+        parsed_query1.included_fields.append("code")
+        parsed_query2 = QueryParser.parse_cached(query)
+
+        self.assertEqual(parsed_query2, QueryParser().parse(query))
+        self.assertNotIn("code", parsed_query2.included_fields)
+
     # *************** retrieve tests **************
 
     def test_retrieve_with_flat_query(self):
@@ -392,6 +488,36 @@ class DataQueryingTests(APITestCase):
                 }
             )
 
+    def test_eager_loading_mappings_declared_on_a_view_are_read_only(self):
+        with self.assertRaises(TypeError):
+            StudentEagerLoadingViewSet.select_related["program"] = "course__instructor"
+        with self.assertRaises(TypeError):
+            del StudentEagerLoadingViewSet.prefetch_related["phone_numbers"]
+
+        self.assertEqual(dict(StudentEagerLoadingViewSet.select_related), {"program": "course"})
+        self.assertEqual(
+            dict(StudentEagerLoadingViewSet.prefetch_related),
+            {"phone_numbers": "phone_numbers", "program.books": "course__books"}
+        )
+
+        # Should still select_related the course and prefetch the books.
+        mixin_url = reverse_lazy("student_eager_loading-detail", args=[self.student.id])
+        with self.assertNumQueries(2):
+            response = self.client.get(mixin_url + '?query={name, program{name, books}}', format="json")
+            self.assertEqual(
+                response.data,
+                {
+                    "name": "Yezy",
+                    "program": {
+                        "name": "Data Structures",
+                        "books": [
+                            {"title": "Advanced Data Structures", "author": "S.Mobit"},
+                            {"title": "Basic Data Structures", "author": "S.Mobit"}
+                        ]
+                    }
+                }
+            )
+
     def test_retrieve_eager_loading_view_mixin_ignored(self):
         """
         Ensure that we do not apply our joining/prefetching if the mapped fields aren't present.
@@ -3098,3 +3224,222 @@ class DataQueryingAndMutationTests(APITestCase):
                 ]
             }
         )
+
+
+class NestedBulkCreateTests(APITestCase):
+    def setUp(self):
+        self.student = Student.objects.create(name="Yezy", age=24)
+
+    def tearDown(self):
+        Book.objects.all().delete()
+        Genre.objects.all().delete()
+        Student.objects.all().delete()
+
+    def test_post_with_create_operation_on_many_to_one_uses_bulk_create(self):
+        data = {
+            "name": "yezy",
+            "age": 33,
+            "phone_numbers": {
+                "create": [
+                    {"number": "076750000", "type": "office"},
+                    {"number": "073008811", "type": "home"}
+                ]
+            }
+        }
+        url = reverse_lazy("wstudent-list")
+        with mock.patch.object(BaseNestedMixin, "can_bulk_create", return_value=True), \
+                mock.patch.object(Phone._default_manager, "bulk_create",
+                                  side_effect=bulk_create_returning_pks) as bulk_create:
+            response = self.client.post(url, data, format="json")
+
+        bulk_create.assert_called_once()
+        student = Student.objects.get(pk=response.data.serializer.instance.pk)
+        self.assertEqual(
+            list(student.phone_numbers.order_by("pk").values_list("number", "type")),
+            [("076750000", "office"), ("073008811", "home")]
+        )
+        self.assertEqual(
+            response.data["phone_numbers"],
+            [
+                {"number": "076750000", "type": "office", "student": student.pk},
+                {"number": "073008811", "type": "home", "student": student.pk}
+            ]
+        )
+
+    def test_bulk_created_pks_follow_input_order(self):
+        genre = Genre.objects.create(title="Fiction", description="Stories")
+        data = [
+            {"title": "A", "author": "Me", "genres": [genre.pk]},
+            {"title": "B", "author": "Me"},
+            {"title": "C", "author": "Me"},
+            {"title": "D", "author": "Me", "genres": [genre.pk]},
+        ]
+        serializer = CourseWithBooksWithGenresSerializer(context={})
+        with mock.patch.object(BaseNestedMixin, "can_bulk_create", return_value=True), \
+                mock.patch.object(Book._default_manager, "bulk_create",
+                                  side_effect=bulk_create_returning_pks) as bulk_create:
+            pks = serializer.bulk_create_objs("books", data)
+
+        # Books with genres can't be bulk created
+        self.assertEqual(len(bulk_create.call_args[0][0]), 2)
+        self.assertEqual(
+            [Book.objects.get(pk=pk).title for pk in pks],
+            ["A", "B", "C", "D"]
+        )
+        self.assertEqual(
+            [Book.objects.get(pk=pk).genres.count() for pk in pks],
+            [1, 0, 0, 1]
+        )
+
+    @skipUnless(
+        getattr(connection.features, "can_return_rows_from_bulk_insert", False),
+        "The database doesn't return pks of bulk inserted rows"
+    )
+    def test_bulk_create_on_database_returning_pks(self):
+        data = [
+            {"number": "076750000", "type": "office", "student": self.student.pk},
+            {"number": "073008811", "type": "home", "student": self.student.pk},
+        ]
+        serializer = WritableStudentSerializer(context={})
+        manager = Phone._default_manager
+        with mock.patch.object(manager, "bulk_create", wraps=manager.bulk_create) as bulk_create:
+            pks = serializer.bulk_create_objs("phone_numbers", data)
+
+        bulk_create.assert_called_once()
+        self.assertEqual(
+            [Phone.objects.get(pk=pk).number for pk in pks],
+            ["076750000", "073008811"]
+        )
+        self.assertEqual(
+            set(Phone.objects.filter(pk__in=pks).values_list("student", flat=True)),
+            {self.student.pk}
+        )
+
+    def test_can_bulk_create(self):
+        def receiver(*args, **kwargs):
+            pass
+
+        class PhoneManager(models.Manager):
+            def create(self, **kwargs):
+                return super().create(**kwargs)
+
+        class PhoneWithCustomSaveSerializer(PhoneSerializer):
+            def save(self, **kwargs):
+                return super().save(**kwargs)
+
+        features = type(connection.features)
+        with mock.patch.object(features, "can_return_rows_from_bulk_insert", True, create=True):
+            self.assertTrue(BaseNestedMixin.can_bulk_create(PhoneSerializer))
+
+            with self.subTest("serializer with custom create"):
+                self.assertFalse(BaseNestedMixin.can_bulk_create(WritableBookSerializer))
+
+            with self.subTest("serializer with custom save"):
+                self.assertFalse(BaseNestedMixin.can_bulk_create(PhoneWithCustomSaveSerializer))
+
+            with self.subTest("model with custom save"):
+                with mock.patch.object(Phone, "save", lambda self, *args, **kwargs: None):
+                    self.assertFalse(BaseNestedMixin.can_bulk_create(PhoneSerializer))
+
+            with self.subTest("multi-table inheritance"):
+                with mock.patch.object(Phone._meta, "parents", {Student: None}):
+                    self.assertFalse(BaseNestedMixin.can_bulk_create(PhoneSerializer))
+
+            with self.subTest("manager with custom create"):
+                with mock.patch.object(Phone._meta, "default_manager", PhoneManager()):
+                    self.assertFalse(BaseNestedMixin.can_bulk_create(PhoneSerializer))
+
+            for signal in (pre_save, post_save):
+                with self.subTest("save signal receiver"):
+                    signal.connect(receiver, sender=Phone)
+                    try:
+                        self.assertFalse(BaseNestedMixin.can_bulk_create(PhoneSerializer))
+                    finally:
+                        signal.disconnect(receiver, sender=Phone)
+
+            with self.subTest("unique field"):
+                with mock.patch.object(Phone._meta.get_field("number"), "_unique", True):
+                    self.assertFalse(BaseNestedMixin.can_bulk_create(PhoneSerializer))
+
+            with self.subTest("unique together"):
+                with mock.patch.object(Phone._meta, "unique_together", (("number", "type"),)):
+                    self.assertFalse(BaseNestedMixin.can_bulk_create(PhoneSerializer))
+
+            with self.subTest("model without constraints attribute"):
+                # Django < 2.2 models don't have `constraints` in their meta
+                constraints = Phone._meta.constraints
+                del Phone._meta.constraints
+                try:
+                    self.assertTrue(BaseNestedMixin.can_bulk_create(PhoneSerializer))
+                finally:
+                    Phone._meta.constraints = constraints
+
+            with self.subTest("unique constraint"):
+                constraint = models.UniqueConstraint(fields=["number"], name="unique_number")
+                with mock.patch.object(Phone._meta, "constraints", [constraint]):
+                    self.assertFalse(BaseNestedMixin.can_bulk_create(PhoneSerializer))
+
+            with self.subTest("database not returning pks"):
+                with mock.patch.object(features, "can_return_rows_from_bulk_insert", False):
+                    self.assertFalse(BaseNestedMixin.can_bulk_create(PhoneSerializer))
+
+
+class NestedBulkUpdateTests(APITestCase):
+    def setUp(self):
+        self.book1 = Book.objects.create(title="Advanced Data Structures", author="S.Mobit")
+        self.book2 = Book.objects.create(title="Basic Data Structures", author="S.Mobit")
+        self.unrelated_book = Book.objects.create(title="Algorithms", author="S.Mobit")
+        self.course = Course.objects.create(name="Data Structures", code="CS210")
+        self.course.books.set([self.book1, self.book2])
+
+    def tearDown(self):
+        Book.objects.all().delete()
+        Course.objects.all().delete()
+        Tag.objects.all().delete()
+
+    def test_update_operation_keeps_pks_order(self):
+        data = {
+            "books": {
+                "update": {
+                    str(self.book2.pk): {"title": "Primitive Data Types"},
+                    str(self.book1.pk): {"author": "M.Json"},
+                }
+            }
+        }
+        serializer = WritableCourseSerializer(self.course, data=data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertEqual(
+            list(self.course.books.order_by("pk").values_list("title", "author")),
+            [
+                ("Advanced Data Structures", "M.Json"),
+                ("Primitive Data Types", "S.Mobit")
+            ]
+        )
+
+    def test_update_operation_with_unrelated_pk(self):
+        data = {
+            "books": {
+                "update": {
+                    str(self.book1.pk): {"title": "Primitive Data Types"},
+                    str(self.unrelated_book.pk): {"title": "React Programming"},
+                }
+            }
+        }
+        serializer = WritableCourseSerializer(self.course, data=data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        with self.assertRaises(Book.DoesNotExist):
+            serializer.save()
+
+        self.unrelated_book.refresh_from_db()
+        self.assertEqual(self.unrelated_book.title, "Algorithms")
+
+    def test_get_objs_to_update_converts_pks(self):
+        tag1 = Tag.objects.create(name="python")
+        tag2 = Tag.objects.create(name="django")
+        objs = NestedUpdateMixin.get_objs_to_update(Tag.objects, [tag2.pk.hex, str(tag1.pk)])
+        self.assertEqual(objs, [tag2, tag1])
+
+        with self.assertRaises(Tag.DoesNotExist):
+            NestedUpdateMixin.get_objs_to_update(Tag.objects, [str(tag1.pk), str(uuid.uuid4())])
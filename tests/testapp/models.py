@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 
 
@@ -35,3 +37,8 @@ class Phone(models.Model):
     number = models.CharField(max_length=15)
     type = models.CharField(max_length=50)
     student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name="phone_numbers")
+
+
+class Tag(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    name = models.CharField(max_length=50)
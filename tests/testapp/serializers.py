@@ -120,6 +120,25 @@ class StudentWithAliasSerializer(DynamicFieldsMixin, serializers.ModelSerializer
         fields = ['name', 'age', 'program', 'phone_numbers']
 
 
+class CourseWithCachedFieldsSerializer(CourseSerializer):
+    cache_restql_fields = True
+
+    class Meta(CourseSerializer.Meta):
+        pass
+
+
+class BookWithContextDependentFieldsSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    class Meta:
+        model = Book
+        fields = ['id', 'title', 'author']
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.context.get("staff", False):
+            fields.pop("author")
+        return fields
+
+
 ############### Serializers for Nested Data Mutation Testing ##############
 class WritableBookSerializer(DynamicFieldsMixin, NestedModelSerializer):
     genres = NestedField(GenreSerializer, many=True, required=False)
@@ -181,3 +200,17 @@ class WritableStudentWithAliasSerializer(DynamicFieldsMixin, NestedModelSerializ
     class Meta:
         model = Student
         fields = ['name', 'age', 'program', 'contacts', 'study_partner', 'sport_mates']
+
+
+class BookWithGenresSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Book
+        fields = ['title', 'author', 'genres']
+
+
+class CourseWithBooksWithGenresSerializer(NestedModelSerializer):
+    books = NestedField(BookWithGenresSerializer, many=True, required=False)
+
+    class Meta:
+        model = Course
+        fields = ['name', 'code', 'books']